@@ -61,8 +61,8 @@ class SetupValidator:
     def check_optional_packages(self):
         """Check optional packages that enhance functionality"""
         optional_packages = {
-            'librosa': 'Advanced audio processing',
             'phonemizer': 'Improved phoneme extraction',
+            'orjson': 'Faster JSON responses',
             'matplotlib': 'Visualization tools'
         }
         
@@ -206,18 +206,19 @@ class SetupValidator:
         
         for js_file in js_files:
             js_path = frontend_dir / 'js' / js_file
-            if js_path.exists():
-                try:
-                    with open(js_path, 'r') as f:
-                        content = f.read()
+            try:
+                with open(js_path, 'r') as f:
+                    content = f.read()
+                
+                if 'export' in content:
+                    self.success_messages.append(f"✓ {js_file} uses ES6 modules")
+                else:
+                    self.warnings.append(f"◉ {js_file} may not be properly exported")
                     
-                    if 'export' in content:
-                        self.success_messages.append(f"✓ {js_file} uses ES6 modules")
-                    else:
-                        self.warnings.append(f"◉ {js_file} may not be properly exported")
-                        
-                except Exception as e:
-                    self.warnings.append(f"◉ Could not validate {js_file}: {e}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.warnings.append(f"◉ Could not validate {js_file}: {e}")
         
         return True
     
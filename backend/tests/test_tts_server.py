@@ -0,0 +1,174 @@
+"""
+Tests for the TTS server's synthesis pipeline.
+Coqui TTS is replaced by a small fake that reproduces its sentence
+splitting and inter-sentence padding, so no model is downloaded.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import tts_server  # noqa: E402
+
+
+class FakeSynthesizer:
+    """Stands in for Coqui's Synthesizer sentence splitter."""
+    
+    def split_into_sentences(self, text):
+        return [sentence.strip() + '.' for sentence in text.split('.') if sentence.strip()]
+
+
+class FakeTTS:
+    """
+    Mimics TTS.api.TTS.tts: every sentence's audio is followed by
+    10000 zero samples, whether or not the text is split.
+    """
+    
+    def __init__(self):
+        self.synthesizer = FakeSynthesizer()
+        self.calls = 0
+    
+    def tts(self, text, split_sentences=True):
+        self.calls += 1
+        sentences = self.synthesizer.split_into_sentences(text) if split_sentences else [text]
+        wav = []
+        for sentence in sentences:
+            wav += [((i * 7 + len(sentence)) % 13) / 13.0 for i in range(len(sentence) * 40)]
+            wav += [0] * 10000
+        return wav
+
+
+def make_controller(**kwargs):
+    controller = tts_server.TTSController(**kwargs)
+    controller.tts = FakeTTS()
+    return controller
+
+
+class SentenceSynthesisTests(unittest.TestCase):
+    
+    def test_split_synthesis_matches_unsplit_call(self):
+        controller = make_controller()
+        text = "Hello there. How are you today. This is a test."
+        
+        expected = np.asarray(controller.tts.tts(text=text), dtype=np.float32)
+        actual = controller._synthesize_sentences(text)
+        
+        np.testing.assert_array_equal(actual, expected)
+    
+    def test_cached_sentences_match_unsplit_call(self):
+        controller = make_controller()
+        text = "Hello there. How are you today."
+        
+        controller._synthesize_sentences(text)
+        calls = controller.tts.calls
+        actual = controller._synthesize_sentences(text)
+        
+        self.assertEqual(controller.tts.calls, calls)
+        expected = np.asarray(controller.tts.tts(text=text), dtype=np.float32)
+        np.testing.assert_array_equal(actual, expected)
+
+
+def reference_phoneme_timing(text, duration):
+    """Per-character timing loop the vectorized extraction must reproduce."""
+    timings = []
+    time_per_char = duration / max(len(text), 1)
+    current_time = 0.0
+    
+    for word in text.lower().split():
+        for char in word:
+            if char.isalpha():
+                timings.append({
+                    'phoneme': tts_server._LETTER_PHONEMES.get(char, 'SIL'),
+                    'start_ms': int(current_time * 1000),
+                    'end_ms': int((current_time + time_per_char * 3) * 1000)
+                })
+                current_time += time_per_char * 3
+            else:
+                current_time += time_per_char
+        
+        timings.append({
+            'phoneme': 'SIL',
+            'start_ms': int(current_time * 1000),
+            'end_ms': int((current_time + 0.1) * 1000)
+        })
+        current_time += 0.1
+    
+    return timings
+
+
+class PhonemeTimingTests(unittest.TestCase):
+    
+    def assert_matches_reference(self, text, duration=2.5):
+        controller = tts_server.TTSController()
+        self.assertEqual(controller._extract_phoneme_timing(text, duration),
+                         reference_phoneme_timing(text, duration))
+    
+    def test_ascii_text(self):
+        self.assert_matches_reference("Hello there, how are you doing today?")
+    
+    def test_non_ascii_letters(self):
+        self.assert_matches_reference("Crème brûlée für Straße")
+    
+    def test_lone_surrogate(self):
+        self.assert_matches_reference("broken \ud800 text")
+
+
+class DiskCacheTests(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_disk_cache_is_disabled_by_default(self):
+        controller = make_controller()
+        
+        self.assertIsNone(controller.cache_dir)
+    
+    def test_disk_cache_round_trip(self):
+        text = "Hello there. How are you today."
+        first = make_controller(cache_dir=self.cache_dir)
+        expected = first._synthesize_sentences(text)
+        
+        # A fresh controller has an empty memory cache and must read from disk
+        second = make_controller(cache_dir=self.cache_dir)
+        actual = second._synthesize_sentences(text)
+        
+        self.assertEqual(second.tts.calls, 0)
+        np.testing.assert_array_equal(actual, expected)
+    
+    def test_disk_cache_evicts_oldest_over_limit(self):
+        controller = make_controller(cache_dir=self.cache_dir)
+        wav = np.zeros(1000, dtype=np.float32)
+        paths = [controller._sentence_cache_path(f"sentence {i}") for i in range(3)]
+        
+        controller._store_cached_sentence(paths[0], wav)
+        file_size = paths[0].stat().st_size
+        controller.cache_max_bytes = 2 * file_size
+        controller._store_cached_sentence(paths[1], wav)
+        controller._store_cached_sentence(paths[2], wav)
+        
+        self.assertFalse(paths[0].exists())
+        self.assertTrue(paths[1].exists())
+        self.assertTrue(paths[2].exists())
+    
+    def test_failed_write_leaves_no_temp_file(self):
+        controller = make_controller(cache_dir=self.cache_dir)
+        cache_path = controller._sentence_cache_path("sentence")
+        
+        with mock.patch.object(tts_server.np, 'save', side_effect=OSError("disk full")):
+            controller._store_cached_sentence(cache_path, np.zeros(10, dtype=np.float32))
+        
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,27 +4,74 @@ Provides text-to-speech synthesis with phoneme timing using Coqui TTS
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 import base64
+import functools
+import hashlib
 import io
 import json
+import logging
 import os
+import sys
+import threading
 import numpy as np
 import soundfile as sf
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
-# TTS imports
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder for large phoneme timing payloads
 try:
-    from TTS.api import TTS
-    from TTS.tts.configs.xtts_config import XttsConfig
-    from TTS.tts.models.xtts import Xtts
-    import torch
+    import orjson
 except ImportError:
-    print("Coqui TTS not installed. Install with: pip install TTS")
-    exit(1)
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Serializes the phoneme timing lists much faster than the stdlib encoder.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Basic phoneme mapping for common English sounds
+_LETTER_PHONEMES = {
+    'a': 'AH', 'e': 'EH', 'i': 'IH', 'o': 'AO', 'u': 'UH',
+    'b': 'B', 'p': 'P', 'f': 'F', 'v': 'V', 'm': 'M',
+    'd': 'D', 't': 'T', 'n': 'N', 'l': 'L', 'r': 'R',
+    'g': 'G', 'k': 'K', 'h': 'HH',
+    's': 'S', 'z': 'Z', 'j': 'JH', 'y': 'Y', 'w': 'W'
+}
+
+# Phoneme id 0 is silence; letters without a mapping fall back to it
+_PHONEME_NAMES = ['SIL'] + list(_LETTER_PHONEMES.values())
+
+# ASCII code -> phoneme id, -1 for characters that are not letters
+_CHAR_TO_PHONEME = np.full(128, -1, dtype=np.int8)
+for _code in range(128):
+    if chr(_code).isalpha():
+        _CHAR_TO_PHONEME[_code] = 0
+for _index, _letter in enumerate(_LETTER_PHONEMES, start=1):
+    _CHAR_TO_PHONEME[ord(_letter)] = _index
+
+# Timing heuristics: a letter lasts three character slots, words are
+# separated by a fixed silence
+_LETTER_SLOTS = 3
+_WORD_GAP_SECONDS = 0.1
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for local development
 
 
@@ -34,32 +81,63 @@ class TTSController:
     Uses Coqui TTS for high-quality neural speech synthesis.
     """
     
-    def __init__(self, model_name: str = "tts_models/en/ljspeech/tacotron2-DDC"):
+    def __init__(self, model_name: str = "tts_models/en/ljspeech/tacotron2-DDC",
+                 sentence_cache_size: int = 64, cache_dir: Optional[Path] = None,
+                 cache_max_bytes: int = 256 * 1024 * 1024):
         """
         Initialize the TTS controller with a specific model.
         
         Args:
             model_name (str): Name of the TTS model to use
+            sentence_cache_size (int): Number of synthesized sentences kept in memory
+            cache_dir (Path): Directory for synthesized sentences kept across runs,
+                or None to keep them in memory only
+            cache_max_bytes (int): Size limit of the on-disk cache; oldest entries are evicted first
         """
         self.model_name = model_name
         self.tts = None
+        self.is_loading = False
         self.sample_rate = 22050
         
+        # LRU cache of synthesized sentences, so repeated preambles are reused
+        self.sentence_cache = OrderedDict()
+        self.sentence_cache_size = sentence_cache_size
+        self._cache_lock = threading.Lock()
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        # On-disk entries (path -> size) from oldest to newest, scanned on first use
+        self._disk_entries = None
+        self._disk_bytes = 0
+        
     def initialize(self) -> bool:
         """
         Load the TTS model and prepare for synthesis.
+        Coqui TTS (and torch) are imported here rather than at module load,
+        so the server can answer health checks while the model warms up.
         
         Returns:
             bool: True if initialization successful, False otherwise
         """
+        self.is_loading = True
         try:
-            print(f"Loading TTS model: {self.model_name}")
+            from TTS.api import TTS
+        except ImportError:
+            logger.error("Coqui TTS not installed. Install with: pip install TTS")
+            self.is_loading = False
+            return False
+        
+        try:
+            logger.info("Loading TTS model: %s", self.model_name)
             self.tts = TTS(model_name=self.model_name, progress_bar=False)
-            print("TTS model loaded successfully")
+            # Use the model's real output rate rather than assuming 22050 Hz
+            self.sample_rate = getattr(self.tts.synthesizer, 'output_sample_rate', self.sample_rate)
+            logger.info("TTS model loaded successfully")
             return True
         except Exception as e:
-            print(f"Failed to load TTS model: {e}")
+            logger.error("Failed to load TTS model: %s", e)
             return False
+        finally:
+            self.is_loading = False
     
     def synthesize(self, text: str, speed: float = 1.0) -> Dict:
         """
@@ -77,11 +155,7 @@ class TTSController:
         
         try:
             # Generate audio
-            wav = self.tts.tts(text=text)
-            
-            # Convert to numpy array if needed
-            if isinstance(wav, list):
-                wav = np.array(wav)
+            wav = self._synthesize_sentences(text)
             
             # Adjust speed if needed
             if speed != 1.0:
@@ -89,22 +163,176 @@ class TTSController:
             
             # Convert to WAV format
             audio_buffer = io.BytesIO()
-            sf.write(audio_buffer, wav, self.sample_rate, format='WAV')
-            audio_base64 = base64.b64encode(audio_buffer.getvalue()).decode('utf-8')
+            sf.write(audio_buffer, wav, self.sample_rate, format='WAV', subtype='PCM_16')
+            audio_base64 = base64.b64encode(audio_buffer.getbuffer()).decode('ascii')
+            duration = len(wav) / self.sample_rate
             
             # Extract phoneme timing (simplified approach)
-            phoneme_timings = self._extract_phoneme_timing(text, len(wav) / self.sample_rate)
+            phoneme_timings = self._extract_phoneme_timing(text, duration)
             
             return {
                 'audio_data': audio_base64,
                 'phoneme_timings': phoneme_timings,
-                'duration': len(wav) / self.sample_rate,
+                'duration': duration,
                 'sample_rate': self.sample_rate
             }
             
         except Exception as e:
             raise RuntimeError(f"TTS synthesis failed: {e}")
     
+    def _synthesize_sentences(self, text: str) -> np.ndarray:
+        """
+        Synthesize text sentence by sentence, reusing cached sentences.
+        Uses Coqui's own sentence splitting. Coqui already appends its
+        inter-sentence pause to each sentence's audio, so concatenating
+        the sentences reproduces the unsplit output sample for sample.
+        
+        Args:
+            text (str): Text to synthesize
+            
+        Returns:
+            np.ndarray: Synthesized audio
+        """
+        sentences = self.tts.synthesizer.split_into_sentences(text)
+        if not sentences:
+            return np.asarray(self.tts.tts(text=text), dtype=np.float32)
+        
+        return np.concatenate([self._synthesize_sentence(sentence) for sentence in sentences])
+    
+    def _synthesize_sentence(self, sentence: str) -> np.ndarray:
+        """
+        Synthesize a single sentence through the LRU sentence cache.
+        
+        Args:
+            sentence (str): Sentence to synthesize
+            
+        Returns:
+            np.ndarray: Synthesized audio for the sentence
+        """
+        with self._cache_lock:
+            wav = self.sentence_cache.get(sentence)
+            if wav is not None:
+                self.sentence_cache.move_to_end(sentence)
+                return wav
+        
+        cache_path = self._sentence_cache_path(sentence) if self.cache_dir is not None else None
+        wav = self._load_cached_sentence(cache_path) if cache_path is not None else None
+        if wav is None:
+            wav = np.asarray(self.tts.tts(text=sentence, split_sentences=False), dtype=np.float32)
+            if cache_path is not None:
+                self._store_cached_sentence(cache_path, wav)
+        
+        with self._cache_lock:
+            self.sentence_cache[sentence] = wav
+            if len(self.sentence_cache) > self.sentence_cache_size:
+                self.sentence_cache.popitem(last=False)
+        
+        return wav
+    
+    def _sentence_cache_path(self, sentence: str) -> Path:
+        """
+        Get the on-disk cache file for a sentence, keyed by model and text.
+        
+        Args:
+            sentence (str): Sentence to synthesize
+            
+        Returns:
+            Path: Location of the cached audio
+        """
+        key = hashlib.blake2b(f"{self.model_name}\0{sentence}".encode('utf-8'), digest_size=16)
+        return self.cache_dir / f"{key.hexdigest()}.npy"
+    
+    def _load_cached_sentence(self, cache_path: Path) -> Optional[np.ndarray]:
+        """
+        Load previously synthesized audio from disk, if present.
+        
+        Args:
+            cache_path (Path): Cache file to read
+            
+        Returns:
+            np.ndarray: Cached audio, or None on a cache miss
+        """
+        try:
+            return np.load(cache_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable sentence cache %s: %s", cache_path, e)
+            return None
+    
+    def _store_cached_sentence(self, cache_path: Path, wav: np.ndarray):
+        """
+        Write synthesized audio to the on-disk cache. Failures are not fatal.
+        
+        Args:
+            cache_path (Path): Cache file to write
+            wav (np.ndarray): Synthesized audio
+        """
+        # Write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, wav)
+                size = f.tell()
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write sentence cache %s: %s", cache_path, e)
+            # A partial temp file is invisible to eviction, so remove it here
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        with self._cache_lock:
+            self._record_disk_entry(cache_path, size)
+    
+    def _record_disk_entry(self, cache_path: Path, size: int):
+        """
+        Track a newly written cache file and evict the oldest files over the size limit.
+        Must be called with the cache lock held.
+        
+        Args:
+            cache_path (Path): Cache file that was written
+            size (int): Size of the file in bytes
+        """
+        if self._disk_entries is None:
+            self._disk_entries = self._scan_disk_cache()
+            self._disk_bytes = sum(self._disk_entries.values())
+        
+        self._disk_bytes -= self._disk_entries.pop(cache_path, 0)
+        self._disk_entries[cache_path] = size
+        self._disk_bytes += size
+        
+        while self._disk_bytes > self.cache_max_bytes and self._disk_entries:
+            old_path, old_size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= old_size
+            try:
+                old_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not evict sentence cache %s: %s", old_path, e)
+    
+    def _scan_disk_cache(self) -> OrderedDict:
+        """
+        List the cache files already on disk, oldest first.
+        
+        Returns:
+            OrderedDict: Cache file path -> size in bytes
+        """
+        entries = []
+        for path in self.cache_dir.glob('*.npy'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path, st.st_size))
+        
+        entries.sort(key=lambda entry: entry[0])
+        return OrderedDict((path, size) for _, path, size in entries)
+    
     def _adjust_speed(self, wav: np.ndarray, speed: float) -> np.ndarray:
         """
         Adjust audio speed by resampling.
@@ -119,12 +347,14 @@ class TTSController:
         if speed == 1.0:
             return wav
         
-        # Simple speed adjustment by changing playback rate
-        # Note: This is a basic implementation. For better quality,
-        # consider using librosa's time stretching
+        # Change the playback rate by linear interpolation on the sample grid,
+        # keeping the result in float32. Pitch shifts with speed.
         target_length = int(len(wav) / speed)
-        indices = np.linspace(0, len(wav) - 1, target_length)
-        return np.interp(indices, np.arange(len(wav)), wav)
+        positions = np.linspace(0, len(wav) - 1, target_length)
+        base = positions.astype(np.intp)
+        following = np.minimum(base + 1, len(wav) - 1)
+        frac = (positions - base).astype(np.float32)
+        return wav[base] + (wav[following] - wav[base]) * frac
     
     def _extract_phoneme_timing(self, text: str, duration: float) -> List[Dict]:
         """
@@ -141,53 +371,86 @@ class TTSController:
         # Simplified phoneme extraction based on text analysis
         # In a real implementation, you'd use forced alignment
         words = text.lower().split()
-        phoneme_timings = []
-        
-        # Basic phoneme mapping for common English sounds
-        phoneme_map = {
-            'a': 'AH', 'e': 'EH', 'i': 'IH', 'o': 'AO', 'u': 'UH',
-            'b': 'B', 'p': 'P', 'f': 'F', 'v': 'V', 'm': 'M',
-            'd': 'D', 't': 'T', 'n': 'N', 'l': 'L', 'r': 'R',
-            'g': 'G', 'k': 'K', 'ng': 'NG', 'h': 'HH',
-            's': 'S', 'z': 'Z', 'sh': 'SH', 'zh': 'ZH',
-            'ch': 'CH', 'j': 'JH', 'y': 'Y', 'w': 'W'
-        }
+        if not words:
+            return []
         
         time_per_char = duration / max(len(text), 1)
-        current_time = 0.0
-        
-        for word in words:
-            for char in word:
-                if char.isalpha():
-                    phoneme = phoneme_map.get(char, 'SIL')
-                    phoneme_timings.append({
-                        'phoneme': phoneme,
-                        'start_ms': int(current_time * 1000),
-                        'end_ms': int((current_time + time_per_char * 3) * 1000)
-                    })
-                    current_time += time_per_char * 3
-                else:
-                    current_time += time_per_char
-            
-            # Add silence between words
-            phoneme_timings.append({
-                'phoneme': 'SIL',
-                'start_ms': int(current_time * 1000),
-                'end_ms': int((current_time + 0.1) * 1000)
-            })
-            current_time += 0.1
         
-        return phoneme_timings
+        # Map every character to a phoneme id in one table lookup;
+        # surrogatepass keeps lone surrogates (non-letters) from failing the encode
+        codes = np.frombuffer(''.join(words).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        ids = _CHAR_TO_PHONEME[np.minimum(codes, 127)]
+        for i in np.flatnonzero(codes > 127):
+            ids[i] = 0 if chr(codes[i]).isalpha() else -1
+        
+        # Letters take several character slots, anything else one
+        durations = np.where(ids >= 0, time_per_char * _LETTER_SLOTS, time_per_char)
+        
+        # Add silence between words
+        word_ends = np.cumsum([len(word) for word in words])
+        ids = np.insert(ids, word_ends, 0)
+        durations = np.insert(durations, word_ends, _WORD_GAP_SECONDS)
+        
+        starts = np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+        ends = starts + durations
+        
+        keep = ids >= 0
+        starts_ms = (starts[keep] * 1000).astype(np.int64).tolist()
+        ends_ms = (ends[keep] * 1000).astype(np.int64).tolist()
+        
+        return [
+            {'phoneme': _PHONEME_NAMES[phoneme_id], 'start_ms': start_ms, 'end_ms': end_ms}
+            for phoneme_id, start_ms, end_ms in zip(ids[keep].tolist(), starts_ms, ends_ms)
+        ]
+
+
+# Synthesized sentences are only written to disk when explicitly enabled
+_DEFAULT_SENTENCE_CACHE_DIR = Path.home() / '.cache' / 'avatar' / 'sentences'
+
+
+def _sentence_cache_settings() -> Tuple[Optional[Path], int]:
+    """
+    Read the on-disk sentence cache settings from the environment.
+    
+    AVATAR_SENTENCE_CACHE=1 enables the cache in ~/.cache/avatar/sentences,
+    AVATAR_SENTENCE_CACHE_DIR overrides the location (and also enables it),
+    AVATAR_SENTENCE_CACHE_MB limits its size (default 256).
+    
+    Returns:
+        tuple: Cache directory (None when disabled) and size limit in bytes
+    """
+    cache_dir = os.environ.get('AVATAR_SENTENCE_CACHE_DIR')
+    enabled = os.environ.get('AVATAR_SENTENCE_CACHE', '').lower() in ('1', 'true', 'yes')
+    
+    if cache_dir:
+        path = Path(cache_dir).expanduser()
+    elif enabled:
+        path = _DEFAULT_SENTENCE_CACHE_DIR
+    else:
+        path = None
+    
+    try:
+        max_mb = int(os.environ.get('AVATAR_SENTENCE_CACHE_MB', '256'))
+    except ValueError:
+        logger.warning("Invalid AVATAR_SENTENCE_CACHE_MB, using 256")
+        max_mb = 256
+    
+    return path, max_mb * 1024 * 1024
 
 
 # Global TTS controller instance
-tts_controller = TTSController()
+_cache_dir, _cache_max_bytes = _sentence_cache_settings()
+tts_controller = TTSController(cache_dir=_cache_dir, cache_max_bytes=_cache_max_bytes)
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'tts_ready': tts_controller.tts is not None})
+    return jsonify({
+        'status': 'healthy',
+        'tts_ready': tts_controller.tts is not None,
+        'tts_loading': tts_controller.is_loading
+    })
 
 
 @app.route('/synthesize', methods=['POST'])
@@ -220,13 +483,18 @@ def synthesize():
         if len(text) > 1000:
             return jsonify({'error': 'Text too long (max 1000 characters)'}), 400
         
+        if tts_controller.tts is None:
+            if tts_controller.is_loading:
+                return jsonify({'error': 'TTS model is still loading'}), 503, {'Retry-After': '5'}
+            return jsonify({'error': 'TTS not initialized'}), 503
+        
         # Synthesize speech
         result = tts_controller.synthesize(text, speed)
         
         return jsonify(result)
         
     except Exception as e:
-        print(f"Synthesis error: {e}")
+        logger.error("Synthesis error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -247,20 +515,35 @@ def get_phoneme_map():
     backend_dir = Path(__file__).parent
     phoneme_map_path = backend_dir / 'assets' / 'phoneme_map.json'
     
-    if phoneme_map_path.exists():
-        try:
-            with open(phoneme_map_path, 'r') as f:
-                phoneme_map = json.load(f)
-        except Exception as e:
-            print(f"Error loading phoneme map from {phoneme_map_path}: {e}")
-            phoneme_map = get_default_phoneme_map()
-    else:
-        print(f"Phoneme map not found at {phoneme_map_path}, using default")
+    try:
+        phoneme_map = _load_phoneme_map(str(phoneme_map_path), phoneme_map_path.stat().st_mtime)
+    except FileNotFoundError:
+        logger.warning("Phoneme map not found at %s, using default", phoneme_map_path)
+        phoneme_map = get_default_phoneme_map()
+    except Exception as e:
+        logger.error("Error loading phoneme map from %s: %s", phoneme_map_path, e)
         phoneme_map = get_default_phoneme_map()
     
     return jsonify(phoneme_map)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_phoneme_map(path: str, mtime: float) -> Dict:
+    """
+    Load a phoneme map file, cached by path and modification time
+    so edits to the file are still picked up.
+    
+    Args:
+        path (str): Path to the phoneme map JSON
+        mtime (float): File modification time, used as part of the cache key
+        
+    Returns:
+        dict: Phoneme to viseme mapping
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def get_default_phoneme_map():
     """Get default phoneme to viseme mapping."""
     return {
@@ -284,7 +567,9 @@ def get_default_phoneme_map():
 
 def main():
     """Initialize and run the TTS server."""
-    print("Initializing TTS Server...")
+    # launch_script.py watches stdout for the ready/started messages
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    logger.info("Initializing TTS Server...")
     
     # Get the backend directory
     backend_dir = Path(__file__).parent
@@ -293,13 +578,17 @@ def main():
     assets_dir = backend_dir / 'assets'
     assets_dir.mkdir(exist_ok=True)
     
-    # Initialize TTS
-    if not tts_controller.initialize():
-        print("Failed to initialize TTS. Please check your installation.")
-        return
+    # Initialize TTS in the background so /health responds immediately
+    def load_model():
+        if tts_controller.initialize():
+            logger.info("TTS Server ready!")
+        else:
+            logger.error("Failed to initialize TTS. Please check your installation.")
+    
+    tts_controller.is_loading = True
+    threading.Thread(target=load_model, daemon=True).start()
     
-    print("TTS Server ready!")
-    print("Starting server on http://localhost:5000")
+    logger.info("Starting server on http://localhost:5000")
     
     # Run the Flask app
     app.run(host='localhost', port=5000, debug=False)
@@ -9,6 +9,23 @@ import { AudioPlayer } from './AudioPlayer.js';
 import { LipSyncController } from './LipSyncController.js';
 import { EmotionAnalyzer } from './EmotionAnalyzer.js';
 
+const STATUS_INDICATORS = {
+    'connecting': { tts: '⏳', avatar: '⏳', emotion: '⏳' },
+    'ready': { tts: '✅', avatar: '✅', emotion: '✅' },
+    'error': { tts: '❌', avatar: '❌', emotion: '❌' },
+    'speaking': { tts: '🔊', avatar: '🎭', emotion: '😊' }
+};
+
+const CONTEXT_KEYWORDS = Object.entries({
+    'greeting': ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'welcome'],
+    'farewell': ['goodbye', 'bye', 'see you', 'farewell', 'until next time', 'take care'],
+    'question': ['what', 'why', 'how', 'when', 'where', 'who', 'which', '?'],
+    'error': ['error', 'problem', 'issue', 'wrong', 'failed', 'cannot', 'unable', 'sorry'],
+    'success': ['great', 'excellent', 'perfect', 'wonderful', 'success', 'completed', 'done'],
+    'thinking': ['hmm', 'let me think', 'considering', 'perhaps', 'maybe', 'possibly'],
+    'confused': ['confused', 'unclear', 'not sure', 'uncertain', 'puzzled', 'bewildered']
+});
+
 export class App {
     constructor() {
         this.avatarController = null;
@@ -23,17 +40,32 @@ export class App {
         this.speedSlider = null;
         this.volumeSlider = null;
         this.statusText = null;
+        this.statusType = null;
         this.emotionControls = null;
         this.contextSelector = null;
         this.eyeTrackingToggle = null;
         this.idleAnimationsToggle = null;
+        this.charCount = null;
+        this.currentEmotionEl = null;
+        this.currentContextEl = null;
         this.emotionIntensitySlider = null;
         
         this.isInitialized = false;
         this.isSpeaking = false;
+        this.buttonsShowSpeaking = null;
         this.currentSynthesis = null;
         this.currentContext = 'neutral';
         
+        // Decoded audio and timings for recently spoken text, keyed by speed and text
+        this.speechCache = new Map();
+        this.speechCacheSize = 8;
+        // Decoded audio is ~11.5 MB per minute at 48 kHz; bound the total held, not just the count
+        this.speechCacheMaxSeconds = 120;
+        this.speechCacheSeconds = 0;
+        
+        // Pending auto-speak after a preset click; rapid clicks replace it
+        this.presetSpeakTimeoutId = null;
+        
         this.emotionSystem = {
             enabled: true,
             autoDetect: true,
@@ -42,6 +74,9 @@ export class App {
             currentEmotion: 'neutral'
         };
         
+        // Emotion whose button currently carries the 'active' class (matches the markup)
+        this.activeEmotionButton = 'neutral';
+        
         this.eyeTracking = {
             enabled: false,
             sensitivity: 0.3,
@@ -49,6 +84,7 @@ export class App {
             currentTarget: { x: 0, y: 0 },
             targetPosition: { x: 0, y: 0 }
         };
+        this.eyeTrackingFrameId = null;
         
         this.contextSystem = {
             enabled: true,
@@ -108,6 +144,9 @@ export class App {
         this.eyeTrackingToggle = document.getElementById('eye-tracking-toggle');
         this.idleAnimationsToggle = document.getElementById('idle-animations-toggle');
         this.emotionIntensitySlider = document.getElementById('emotion-intensity');
+        this.charCount = document.getElementById('char-count');
+        this.currentEmotionEl = document.getElementById('current-emotion');
+        this.currentContextEl = document.getElementById('current-context');
         
         const elements = [
             this.textInput, this.speakBtn, this.stopBtn,
@@ -159,7 +198,7 @@ export class App {
         
         this.textInput.addEventListener('input', () => {
             const count = this.textInput.value.length;
-            const charCount = document.getElementById('char-count');
+            const charCount = this.charCount;
             if (charCount) {
                 charCount.textContent = count;
                 if (count > 900) {
@@ -172,16 +211,25 @@ export class App {
             }
         });
         
-        document.querySelectorAll('.emotion-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
+        // One delegated listener covers every emotion button
+        const emotionButtons = document.querySelector('.emotion-buttons');
+        if (emotionButtons) {
+            emotionButtons.addEventListener('click', (e) => {
+                const btn = e.target.closest('.emotion-btn');
+                if (!btn) return;
+                
                 const emotion = btn.getAttribute('data-emotion');
                 this.triggerEmotion(emotion);
                 this.updateEmotionButtonStates(emotion);
             });
-        });
+        }
         
-        document.querySelectorAll('.preset-btn').forEach(btn => {
-            btn.addEventListener('click', () => {
+        const presetMessages = document.querySelector('.preset-messages');
+        if (presetMessages) {
+            presetMessages.addEventListener('click', (e) => {
+                const btn = e.target.closest('.preset-btn');
+                if (!btn) return;
+                
                 const text = btn.getAttribute('data-text');
                 const context = btn.getAttribute('data-context');
                 
@@ -192,18 +240,22 @@ export class App {
                     this.contextSelector.dispatchEvent(new Event('change'));
                 }
                 
-                const charCount = document.getElementById('char-count');
-                if (charCount) {
-                    charCount.textContent = text.length;
+                if (this.charCount) {
+                    this.charCount.textContent = text.length;
                 }
                 
                 if (!this.isSpeaking) {
-                    setTimeout(() => {
+                    if (this.presetSpeakTimeoutId !== null) {
+                        clearTimeout(this.presetSpeakTimeoutId);
+                    }
+                    
+                    this.presetSpeakTimeoutId = setTimeout(() => {
+                        this.presetSpeakTimeoutId = null;
                         this.speakBtn.click();
                     }, 500);
                 }
             });
-        });
+        }
         
         if (this.contextSelector) {
             this.contextSelector.addEventListener('change', this.handleContextChange);
@@ -318,13 +370,32 @@ export class App {
             
             this.setStatus('Synthesizing speech...', 'speaking');
             
-            const synthesis = await this.ttsController.synthesize(text, speed);
-            this.currentSynthesis = synthesis;
-            
-            this.setStatus('Playing speech with expressions...', 'speaking');
+            const cacheKey = `${speed}|${text}`;
+            const cached = this.getCachedSpeech(cacheKey);
             
-            await this.audioPlayer.loadBase64Audio(synthesis.audio_data);
-            this.lipSyncController.loadTimings(synthesis.phoneme_timings);
+            if (cached) {
+                this.currentSynthesis = cached.synthesis;
+                
+                this.setStatus('Playing speech with expressions...', 'speaking');
+                
+                this.audioPlayer.setAudioBuffer(cached.audioBuffer);
+                this.lipSyncController.loadTimings(cached.synthesis.phoneme_timings);
+            } else {
+                const synthesis = await this.ttsController.synthesize(text, speed);
+                this.currentSynthesis = synthesis;
+                
+                this.setStatus('Playing speech with expressions...', 'speaking');
+                
+                // Audio decoding runs off the main thread; prepare the lip sync
+                // schedule while it is in flight. Promise.all keeps a decode
+                // failure handled even if loadTimings throws first
+                await Promise.all([
+                    this.audioPlayer.loadBase64Audio(synthesis.audio_data),
+                    Promise.resolve().then(() => this.lipSyncController.loadTimings(synthesis.phoneme_timings))
+                ]);
+                
+                this.cacheSpeech(cacheKey, this.audioPlayer.audioBuffer, synthesis);
+            }
             
             await this.audioPlayer.play(this.onSpeechEnd);
             this.lipSyncController.start();
@@ -338,6 +409,49 @@ export class App {
         }
     }
     
+    getCachedSpeech(cacheKey) {
+        const cached = this.speechCache.get(cacheKey);
+        
+        if (cached) {
+            // Re-insert so the Map's insertion order tracks recency
+            this.speechCache.delete(cacheKey);
+            this.speechCache.set(cacheKey, cached);
+        }
+        
+        return cached;
+    }
+    
+    cacheSpeech(cacheKey, audioBuffer, synthesis) {
+        // Channel-seconds, so stereo buffers count for their real size
+        const seconds = audioBuffer.duration * audioBuffer.numberOfChannels;
+        if (seconds > this.speechCacheMaxSeconds) return;
+        
+        const existing = this.speechCache.get(cacheKey);
+        if (existing) {
+            this.speechCacheSeconds -= existing.seconds;
+            this.speechCache.delete(cacheKey);
+        }
+        
+        this.speechCache.set(cacheKey, {
+            audioBuffer: audioBuffer,
+            seconds: seconds,
+            synthesis: {
+                phoneme_timings: synthesis.phoneme_timings,
+                duration: synthesis.duration,
+                sample_rate: synthesis.sample_rate
+            }
+        });
+        
+        this.speechCacheSeconds += seconds;
+        
+        while (this.speechCache.size > this.speechCacheSize ||
+               this.speechCacheSeconds > this.speechCacheMaxSeconds) {
+            const oldestKey = this.speechCache.keys().next().value;
+            this.speechCacheSeconds -= this.speechCache.get(oldestKey).seconds;
+            this.speechCache.delete(oldestKey);
+        }
+    }
+    
     analyzeAndSetContext(text) {
         if (this.emotionSystem.autoDetect && this.emotionAnalyzer) {
             const analysis = this.emotionAnalyzer.analyze(text);
@@ -352,28 +466,22 @@ export class App {
         } else {
             const lowercaseText = text.toLowerCase();
             
-            const contextKeywords = {
-                'greeting': ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'welcome'],
-                'farewell': ['goodbye', 'bye', 'see you', 'farewell', 'until next time', 'take care'],
-                'question': ['what', 'why', 'how', 'when', 'where', 'who', 'which', '?'],
-                'error': ['error', 'problem', 'issue', 'wrong', 'failed', 'cannot', 'unable', 'sorry'],
-                'success': ['great', 'excellent', 'perfect', 'wonderful', 'success', 'completed', 'done'],
-                'thinking': ['hmm', 'let me think', 'considering', 'perhaps', 'maybe', 'possibly'],
-                'confused': ['confused', 'unclear', 'not sure', 'uncertain', 'puzzled', 'bewildered']
-            };
-            
             let detectedContext = 'neutral';
             let maxMatches = 0;
             
-            Object.keys(contextKeywords).forEach(context => {
-                const keywords = contextKeywords[context];
-                const matches = keywords.filter(keyword => lowercaseText.includes(keyword)).length;
+            for (const [context, keywords] of CONTEXT_KEYWORDS) {
+                let matches = 0;
+                for (const keyword of keywords) {
+                    if (lowercaseText.includes(keyword)) {
+                        matches++;
+                    }
+                }
                 
                 if (matches > maxMatches) {
                     maxMatches = matches;
                     detectedContext = context;
                 }
-            });
+            }
             
             if (this.contextSystem.enabled && maxMatches > 0) {
                 this.setContext(detectedContext);
@@ -392,9 +500,8 @@ export class App {
             this.contextSelector.value = context;
         }
         
-        const currentContextEl = document.getElementById('current-context');
-        if (currentContextEl) {
-            currentContextEl.textContent = context;
+        if (this.currentContextEl) {
+            this.currentContextEl.textContent = context;
         }
         
         console.log(`Context set to: ${context}`);
@@ -414,20 +521,25 @@ export class App {
         this.emotionSystem.currentEmotion = emotion;
         this.avatarController.triggerExpression(emotion, emotionIntensity, this.emotionSystem.duration);
         
-        const currentEmotionEl = document.getElementById('current-emotion');
-        if (currentEmotionEl) {
-            currentEmotionEl.textContent = emotion;
+        if (this.currentEmotionEl) {
+            this.currentEmotionEl.textContent = emotion;
         }
         
         console.log(`Triggered emotion: ${emotion} at ${Math.round(emotionIntensity * 100)}%`);
     }
     
     updateEmotionButtonStates(activeEmotion) {
+        if (activeEmotion === this.activeEmotionButton) return;
+        
+        const previous = this.activeEmotionButton;
+        this.activeEmotionButton = activeEmotion;
+        
+        // Only the previously and newly active buttons change state
         document.querySelectorAll('.emotion-btn').forEach(btn => {
             const emotion = btn.getAttribute('data-emotion');
             if (emotion === activeEmotion) {
                 btn.classList.add('active');
-            } else {
+            } else if (emotion === previous) {
                 btn.classList.remove('active');
             }
         });
@@ -444,7 +556,9 @@ export class App {
     setEyeTracking(enabled) {
         this.eyeTracking.enabled = enabled;
         
-        if (!enabled) {
+        if (enabled) {
+            this.startEyeTrackingUpdate();
+        } else {
             this.avatarController.setEyeLookDirection(0, 0);
         }
         
@@ -465,25 +579,31 @@ export class App {
     }
     
     startEyeTrackingUpdate() {
-        const updateEyeTracking = () => {
-            if (this.eyeTracking.enabled) {
-                const smoothing = this.eyeTracking.smoothing;
-                
-                this.eyeTracking.currentTarget.x += 
-                    (this.eyeTracking.targetPosition.x - this.eyeTracking.currentTarget.x) * smoothing;
-                this.eyeTracking.currentTarget.y += 
-                    (this.eyeTracking.targetPosition.y - this.eyeTracking.currentTarget.y) * smoothing;
-                
-                this.avatarController.setEyeLookDirection(
-                    this.eyeTracking.currentTarget.x,
-                    this.eyeTracking.currentTarget.y
-                );
-            }
-            
-            requestAnimationFrame(updateEyeTracking);
-        };
+        // The loop only runs while eye tracking is on; setEyeTracking restarts it
+        if (!this.eyeTracking.enabled || this.eyeTrackingFrameId !== null) return;
+        
+        this.eyeTrackingFrameId = requestAnimationFrame(this.updateEyeTracking);
+    }
+    
+    updateEyeTracking() {
+        if (!this.eyeTracking.enabled) {
+            this.eyeTrackingFrameId = null;
+            return;
+        }
         
-        updateEyeTracking();
+        const smoothing = this.eyeTracking.smoothing;
+        
+        this.eyeTracking.currentTarget.x += 
+            (this.eyeTracking.targetPosition.x - this.eyeTracking.currentTarget.x) * smoothing;
+        this.eyeTracking.currentTarget.y += 
+            (this.eyeTracking.targetPosition.y - this.eyeTracking.currentTarget.y) * smoothing;
+        
+        this.avatarController.setEyeLookDirection(
+            this.eyeTracking.currentTarget.x,
+            this.eyeTracking.currentTarget.y
+        );
+        
+        this.eyeTrackingFrameId = requestAnimationFrame(this.updateEyeTracking);
     }
     
     handleStop() {
@@ -542,13 +662,17 @@ export class App {
     }
     
     updateButtonStates() {
+        // Stop and playback end can both report the same state; only real changes touch the DOM
+        if (this.buttonsShowSpeaking === this.isSpeaking) return;
+        this.buttonsShowSpeaking = this.isSpeaking;
+        
         this.speakBtn.disabled = this.isSpeaking;
         this.stopBtn.disabled = !this.isSpeaking;
         
         if (this.isSpeaking) {
-            this.speakBtn.innerHTML = '⏳ Speaking...';
+            this.speakBtn.textContent = '⏳ Speaking...';
         } else {
-            this.speakBtn.innerHTML = '🎤 Speak';
+            this.speakBtn.textContent = '🎤 Speak';
         }
     }
     
@@ -557,17 +681,16 @@ export class App {
         
         this.statusText.textContent = message;
         
+        console.log(`[${type.toUpperCase()}] ${message}`);
+        
+        // Consecutive messages usually share a type; class and indicators are already set
+        if (type === this.statusType) return;
+        this.statusType = type;
+        
         this.statusText.classList.remove('status-connecting', 'status-ready', 'status-error', 'status-speaking');
         this.statusText.classList.add(`status-${type}`);
         
-        const statusIndicators = {
-            'connecting': { tts: '⏳', avatar: '⏳', emotion: '⏳' },
-            'ready': { tts: '✅', avatar: '✅', emotion: '✅' },
-            'error': { tts: '❌', avatar: '❌', emotion: '❌' },
-            'speaking': { tts: '🔊', avatar: '🎭', emotion: '😊' }
-        };
-        
-        const indicators = statusIndicators[type];
+        const indicators = STATUS_INDICATORS[type];
         if (indicators) {
             const ttsStatus = document.getElementById('tts-status');
             const avatarStatus = document.getElementById('avatar-status');
@@ -577,8 +700,6 @@ export class App {
             if (avatarStatus) avatarStatus.textContent = `Avatar: ${indicators.avatar}`;
             if (emotionStatus) emotionStatus.textContent = `Emotions: ${indicators.emotion}`;
         }
-        
-        console.log(`[${type.toUpperCase()}] ${message}`);
     }
     
     hideLoadingOverlay() {
@@ -611,6 +732,19 @@ export class App {
         if (this.lipSyncController) {
             this.lipSyncController.cleanup();
         }
+        
+        this.speechCache.clear();
+        this.speechCacheSeconds = 0;
+        
+        if (this.eyeTrackingFrameId !== null) {
+            cancelAnimationFrame(this.eyeTrackingFrameId);
+            this.eyeTrackingFrameId = null;
+        }
+        
+        if (this.presetSpeakTimeoutId !== null) {
+            clearTimeout(this.presetSpeakTimeoutId);
+            this.presetSpeakTimeoutId = null;
+        }
     }
 }
 
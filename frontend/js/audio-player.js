@@ -18,6 +18,10 @@ export class AudioPlayer {
         
         this.onEndedCallback = null;
         
+        // Effect buffers are deterministic enough to build once and reuse
+        this.reverbImpulse = null;
+        this.distortionCurves = new Map();
+        
         this.handleEnded = this.handleEnded.bind(this);
     }
     
@@ -51,13 +55,10 @@ export class AudioPlayer {
         }
         
         try {
-            const binaryString = atob(base64Data);
-            const arrayBuffer = new ArrayBuffer(binaryString.length);
-            const uint8Array = new Uint8Array(arrayBuffer);
-            
-            for (let i = 0; i < binaryString.length; i++) {
-                uint8Array[i] = binaryString.charCodeAt(i);
-            }
+            // Let the browser decode the base64 payload natively instead of
+            // copying it into a buffer one byte at a time
+            const response = await fetch(`data:application/octet-stream;base64,${base64Data}`);
+            const arrayBuffer = await response.arrayBuffer();
             
             this.audioBuffer = await this.audioContext.decodeAudioData(arrayBuffer);
             
@@ -73,6 +74,14 @@ export class AudioPlayer {
         }
     }
     
+    setAudioBuffer(audioBuffer) {
+        if (!audioBuffer) {
+            throw new Error('Invalid audio buffer');
+        }
+        
+        this.audioBuffer = audioBuffer;
+    }
+    
     async loadAudioFromUrl(url) {
         if (!this.audioContext) {
             throw new Error('Audio context not initialized');
@@ -202,6 +211,24 @@ export class AudioPlayer {
         return Math.max(0, elapsed * 1000);
     }
     
+    getAudibleTimeMs() {
+        if (!this.isPlaying || !this.audioContext) {
+            return this.getCurrentTimeMs();
+        }
+        
+        // currentTime is when samples are scheduled, not when they are heard;
+        // subtract the output latency so lip sync tracks what is audible
+        return Math.max(0, this.getCurrentTimeMs() - this.getOutputLatency() * 1000);
+    }
+    
+    getOutputLatency() {
+        if (!this.audioContext) {
+            return 0;
+        }
+        
+        return this.audioContext.outputLatency || this.audioContext.baseLatency || 0;
+    }
+    
     getCurrentTimeSeconds() {
         return this.getCurrentTimeMs() / 1000;
     }
@@ -288,6 +315,8 @@ export class AudioPlayer {
             this.audioContext = null;
             this.audioBuffer = null;
             this.onEndedCallback = null;
+            this.reverbImpulse = null;
+            this.distortionCurves.clear();
             
             console.log('Audio Player cleaned up');
             
@@ -311,6 +340,49 @@ export class AudioPlayer {
         return analyser;
     }
     
+    getReverbImpulse() {
+        const sampleRate = this.audioContext.sampleRate;
+        
+        if (this.reverbImpulse && this.reverbImpulse.sampleRate === sampleRate) {
+            return this.reverbImpulse;
+        }
+        
+        // Create impulse response for reverb
+        const impulseLength = sampleRate * 2;
+        const impulse = this.audioContext.createBuffer(2, impulseLength, sampleRate);
+        
+        for (let channel = 0; channel < 2; channel++) {
+            const channelData = impulse.getChannelData(channel);
+            const step = 1 / impulseLength;
+            for (let i = 0; i < impulseLength; i++) {
+                const decay = 1 - i * step;
+                channelData[i] = (Math.random() * 2 - 1) * decay * decay;
+            }
+        }
+        
+        this.reverbImpulse = impulse;
+        return impulse;
+    }
+    
+    getDistortionCurve(amount) {
+        let curve = this.distortionCurves.get(amount);
+        if (curve) {
+            return curve;
+        }
+        
+        const samples = 44100;
+        const deg = Math.PI / 180;
+        curve = new Float32Array(samples);
+        
+        for (let i = 0; i < samples; i++) {
+            const x = (i * 2) / samples - 1;
+            curve[i] = ((3 + amount) * x * 20 * deg) / (Math.PI + amount * Math.abs(x));
+        }
+        
+        this.distortionCurves.set(amount, curve);
+        return curve;
+    }
+    
     applyAudioEffects(effects = {}) {
         if (!this.audioContext || !this.sourceNode) {
             console.warn('Cannot apply effects: audio context or source not available');
@@ -320,16 +392,7 @@ export class AudioPlayer {
         try {
             if (effects.reverb) {
                 const convolver = this.audioContext.createConvolver();
-                // Create impulse response for reverb
-                const impulseLength = this.audioContext.sampleRate * 2;
-                const impulse = this.audioContext.createBuffer(2, impulseLength, this.audioContext.sampleRate);
-                
-                for (let channel = 0; channel < 2; channel++) {
-                    const channelData = impulse.getChannelData(channel);
-                    for (let i = 0; i < impulseLength; i++) {
-                        channelData[i] = (Math.random() * 2 - 1) * Math.pow(1 - i / impulseLength, 2);
-                    }
-                }
+                const impulse = this.getReverbImpulse();
                 
                 convolver.buffer = impulse;
                 this.sourceNode.connect(convolver);
@@ -359,14 +422,7 @@ export class AudioPlayer {
             if (effects.distortion) {
                 const waveshaper = this.audioContext.createWaveShaper();
                 const amount = effects.distortion.amount || 50;
-                const samples = 44100;
-                const curve = new Float32Array(samples);
-                const deg = Math.PI / 180;
-                
-                for (let i = 0; i < samples; i++) {
-                    const x = (i * 2) / samples - 1;
-                    curve[i] = ((3 + amount) * x * 20 * deg) / (Math.PI + amount * Math.abs(x));
-                }
+                const curve = this.getDistortionCurve(amount);
                 
                 waveshaper.curve = curve;
                 waveshaper.oversample = '4x';
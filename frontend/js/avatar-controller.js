@@ -3,6 +3,8 @@
  * Supports glTF models, comprehensive facial expressions, and emotion systems
  */
 
+const EMOTION_EXPRESSIONS = new Set(['happy', 'sad', 'angry', 'surprised', 'disgusted', 'fearful']);
+
 export class AvatarController {
     constructor(canvasId) {
         this.canvasId = canvasId;
@@ -50,9 +52,11 @@ export class AvatarController {
             eyeRightLeft: { intensity: 0, target: 0 },
             eyeRightRight: { intensity: 0, target: 0 }
         };
+        this.expressionNames = Object.keys(this.expressions);
+        this.visemeMorphNames = Array.from({ length: 14 }, (_, i) => `viseme_${i}`);
         
-        this.visemeWeights = new Array(14).fill(0);
-        this.targetVisemeWeights = new Array(14).fill(0);
+        this.visemeWeights = new Float32Array(14);
+        this.targetVisemeWeights = new Float32Array(14);
         this.visemeBlendSpeed = 0.15;
         
         this.isAnimating = false;
@@ -71,6 +75,8 @@ export class AvatarController {
             microExpressionTime: 0
         };
         
+        // Pending reset timeout per expression; re-triggering an expression replaces its own
+        this.expressionResetTimeouts = new Map();
         this.expressionBlendSpeed = 0.08;
         this.emotionDecayRate = 0.95;
         
@@ -83,8 +89,14 @@ export class AvatarController {
             enableShadows: true
         };
         
+        this.renderWidth = 0;
+        this.renderHeight = 0;
+        this.resizeTimeoutId = null;
+        this.resizeDebounceMs = 30;
+        
         this.animate = this.animate.bind(this);
         this.onWindowResize = this.onWindowResize.bind(this);
+        this.scheduleResize = this.scheduleResize.bind(this);
         this.onProgress = this.onProgress.bind(this);
         this.onError = this.onError.bind(this);
     }
@@ -105,7 +117,7 @@ export class AvatarController {
             
             await this.loadAvatar();
             
-            window.addEventListener('resize', this.onWindowResize);
+            window.addEventListener('resize', this.scheduleResize);
             
             this.startAnimation();
             
@@ -124,17 +136,21 @@ export class AvatarController {
     }
     
     setupEnvironment() {
+        // The gradient is vertical only, so a narrow strip stretched by
+        // linear filtering looks identical to a full-size canvas
+        const width = 2;
+        const height = 256;
         const canvas = document.createElement('canvas');
-        canvas.width = 512;
-        canvas.height = 512;
+        canvas.width = width;
+        canvas.height = height;
         const ctx = canvas.getContext('2d');
         
-        const gradient = ctx.createLinearGradient(0, 0, 0, 512);
+        const gradient = ctx.createLinearGradient(0, 0, 0, height);
         gradient.addColorStop(0, '#87CEEB');
         gradient.addColorStop(1, '#E0F6FF');
         
         ctx.fillStyle = gradient;
-        ctx.fillRect(0, 0, 512, 512);
+        ctx.fillRect(0, 0, width, height);
         
         const backgroundTexture = new THREE.CanvasTexture(canvas);
         this.scene.background = backgroundTexture;
@@ -156,7 +172,9 @@ export class AvatarController {
             powerPreference: 'high-performance'
         });
         
-        this.renderer.setSize(this.canvas.clientWidth, this.canvas.clientHeight);
+        this.renderWidth = this.canvas.clientWidth;
+        this.renderHeight = this.canvas.clientHeight;
+        this.renderer.setSize(this.renderWidth, this.renderHeight);
         this.renderer.setPixelRatio(Math.min(window.devicePixelRatio, 2));
         
         this.renderer.shadowMap.enabled = true;
@@ -173,8 +191,9 @@ export class AvatarController {
         const keyLight = new THREE.DirectionalLight(0xffeedd, 1.5);
         keyLight.position.set(3, 6, 4);
         keyLight.castShadow = true;
-        keyLight.shadow.mapSize.width = 4096;
-        keyLight.shadow.mapSize.height = 4096;
+        // Matches the 'high' quality preset; the canvas never shows more shadow detail
+        keyLight.shadow.mapSize.width = 2048;
+        keyLight.shadow.mapSize.height = 2048;
         keyLight.shadow.camera.near = 0.5;
         keyLight.shadow.camera.far = 20;
         keyLight.shadow.camera.left = -5;
@@ -558,11 +577,14 @@ export class AvatarController {
         hair.scale.set(1, 0.8, 1);
         parentGroup.add(hair);
         
-        for (let i = 0; i < 20; i++) {
-            const strandGeometry = new THREE.CylinderGeometry(0.002, 0.001, 0.3, 8);
-            const strand = new THREE.Mesh(strandGeometry, hairMaterial);
-            
-            const angle = (i / 20) * Math.PI * 2;
+        // Every strand has the same shape, so they are drawn as instances in one call
+        const strandCount = 20;
+        const strandGeometry = new THREE.CylinderGeometry(0.002, 0.001, 0.3, 8);
+        const strands = new THREE.InstancedMesh(strandGeometry, hairMaterial, strandCount);
+        const strand = new THREE.Object3D();
+        
+        for (let i = 0; i < strandCount; i++) {
+            const angle = (i / strandCount) * Math.PI * 2;
             const radius = 0.35 + Math.random() * 0.05;
             strand.position.set(
                 Math.cos(angle) * radius,
@@ -571,9 +593,16 @@ export class AvatarController {
             );
             strand.rotation.z = (Math.random() - 0.5) * 0.3;
             strand.rotation.x = (Math.random() - 0.5) * 0.2;
+            strand.updateMatrix();
             
-            parentGroup.add(strand);
+            strands.setMatrixAt(i, strand.matrix);
         }
+        
+        strands.instanceMatrix.needsUpdate = true;
+        // r128 culls instanced meshes by the base geometry's bounds at the group origin,
+        // which lies outside the view even though every strand sits on the head
+        strands.frustumCulled = false;
+        parentGroup.add(strands);
     }
     
     createDetailedBody(parentGroup) {
@@ -608,73 +637,35 @@ export class AvatarController {
     }
     
     setupProceduralMorphTargets() {
-        this.proceduralVisemeShapes = {
-            0: {
-                upperLipScale: { x: 1.2, y: 0.6, z: 0.8 },
-                lowerLipScale: { x: 1.1, y: 0.8, z: 0.8 },
-                upperLipPos: { y: 0.02 },
-                lowerLipPos: { y: -0.02 },
-                showTeeth: false,
-                showTongue: false
-            },
-            1: {
-                upperLipScale: { x: 0.8, y: 0.6, z: 1.2 },
-                lowerLipScale: { x: 0.7, y: 0.6, z: 1.2 },
-                upperLipPos: { y: 0.01 },
-                lowerLipPos: { y: -0.01 },
-                showTeeth: false,
-                showTongue: false
-            },
-            5: {
-                upperLipScale: { x: 1.0, y: 0.3, z: 0.6 },
-                lowerLipScale: { x: 1.0, y: 0.3, z: 0.6 },
-                upperLipPos: { y: -0.01 },
-                lowerLipPos: { y: 0.01 },
-                showTeeth: false,
-                showTongue: false
-            },
-            6: {
-                upperLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-                lowerLipScale: { x: 1.0, y: 0.8, z: 0.8 },
-                upperLipPos: { y: 0 },
-                lowerLipPos: { y: -0.03 },
-                showTeeth: true,
-                showTongue: false
-            },
-            7: {
-                upperLipScale: { x: 1.1, y: 0.5, z: 0.8 },
-                lowerLipScale: { x: 1.0, y: 0.5, z: 0.8 },
-                upperLipPos: { y: 0.01 },
-                lowerLipPos: { y: -0.01 },
-                showTeeth: true,
-                showTongue: true
-            },
-            9: {
-                upperLipScale: { x: 1.1, y: 0.4, z: 0.8 },
-                lowerLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-                upperLipPos: { y: 0.005 },
-                lowerLipPos: { y: -0.005 },
-                showTeeth: true,
-                showTongue: false
-            },
-            13: {
-                upperLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-                lowerLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-                upperLipPos: { y: 0 },
-                lowerLipPos: { y: 0 },
-                showTeeth: false,
-                showTongue: false
-            }
+        // Mouth shape per viseme, packed as
+        // [upper lip scale x, y, z, lower lip scale x, y, z, upper lip offset y, lower lip offset y]
+        const shapes = {
+            0: { values: [1.2, 0.6, 0.8, 1.1, 0.8, 0.8, 0.02, -0.02], showTeeth: false, showTongue: false },
+            1: { values: [0.8, 0.6, 1.2, 0.7, 0.6, 1.2, 0.01, -0.01], showTeeth: false, showTongue: false },
+            5: { values: [1.0, 0.3, 0.6, 1.0, 0.3, 0.6, -0.01, 0.01], showTeeth: false, showTongue: false },
+            6: { values: [1.0, 0.4, 0.8, 1.0, 0.8, 0.8, 0, -0.03], showTeeth: true, showTongue: false },
+            7: { values: [1.1, 0.5, 0.8, 1.0, 0.5, 0.8, 0.01, -0.01], showTeeth: true, showTongue: true },
+            9: { values: [1.1, 0.4, 0.8, 1.0, 0.4, 0.8, 0.005, -0.005], showTeeth: true, showTongue: false },
+            13: { values: [1.0, 0.4, 0.8, 1.0, 0.4, 0.8, 0, 0], showTeeth: false, showTongue: false }
         };
         
-        this.currentMouthState = {
-            upperLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-            lowerLipScale: { x: 1.0, y: 0.4, z: 0.8 },
-            upperLipPos: { y: 0 },
-            lowerLipPos: { y: 0 },
-            showTeeth: false,
-            showTongue: false
-        };
+        const stride = 8;
+        this.proceduralVisemeStride = stride;
+        this.proceduralVisemeShapes = new Float32Array(14 * stride);
+        this.proceduralVisemeTeeth = new Uint8Array(14);
+        this.proceduralVisemeTongue = new Uint8Array(14);
+        
+        // Visemes without a dedicated shape use the neutral one
+        for (let viseme = 0; viseme < 14; viseme++) {
+            const shape = shapes[viseme] || shapes[13];
+            this.proceduralVisemeShapes.set(shape.values, viseme * stride);
+            this.proceduralVisemeTeeth[viseme] = shape.showTeeth ? 1 : 0;
+            this.proceduralVisemeTongue[viseme] = shape.showTongue ? 1 : 0;
+        }
+        
+        // Current upper and lower lip scales, blended towards the target shape
+        this.currentMouthState = new Float32Array([1.0, 0.4, 0.8, 1.0, 0.4, 0.8]);
+        this.appliedMouthViseme = -1;
     }
     
     setupFacialExpressionSystem() {
@@ -689,8 +680,9 @@ export class AvatarController {
     }
     
     setupIdleAnimations() {
-        this.idleSystem.lastBlinkTime = Date.now();
-        this.idleSystem.nextBlinkTime = Date.now() + this.idleSystem.blinkInterval + Math.random() * 2000;
+        this.idleSystem.blinkTimer = 0;
+        this.idleSystem.lastBlinkTime = 0;
+        this.idleSystem.nextBlinkTime = this.idleSystem.blinkInterval + Math.random() * 2000;
     }
     
     setExpression(expression, intensity = 1.0, duration = 500) {
@@ -701,13 +693,12 @@ export class AvatarController {
         
         this.expressions[expression].target = Math.max(0, Math.min(1, intensity));
         
-        const emotions = ['happy', 'sad', 'angry', 'surprised', 'disgusted', 'fearful'];
-        if (emotions.includes(expression) && intensity > 0) {
-            emotions.forEach(emotion => {
+        if (intensity > 0 && EMOTION_EXPRESSIONS.has(expression)) {
+            for (const emotion of EMOTION_EXPRESSIONS) {
                 if (emotion !== expression) {
                     this.expressions[emotion].target = 0;
                 }
-            });
+            }
             this.expressions.neutral.target = 0;
         }
         
@@ -717,25 +708,36 @@ export class AvatarController {
     triggerExpression(expression, intensity = 1.0, duration = 2000) {
         this.setExpression(expression, intensity);
         
-        setTimeout(() => {
+        // A newer trigger of the same expression must not be cut short by this one's reset
+        const pending = this.expressionResetTimeouts.get(expression);
+        if (pending !== undefined) {
+            clearTimeout(pending);
+        }
+        
+        const timeoutId = setTimeout(() => {
+            this.expressionResetTimeouts.delete(expression);
+            
             this.setExpression(expression, 0);
             this.setExpression('neutral', 1);
         }, duration);
+        this.expressionResetTimeouts.set(expression, timeoutId);
     }
     
     setEyeLookDirection(x, y) {
         const clampedX = Math.max(-1, Math.min(1, x));
         const clampedY = Math.max(-1, Math.min(1, y));
         
-        this.expressions.eyeLeftLeft.target = clampedX < 0 ? -clampedX : 0;
-        this.expressions.eyeLeftRight.target = clampedX > 0 ? clampedX : 0;
-        this.expressions.eyeLeftUp.target = clampedY > 0 ? clampedY : 0;
-        this.expressions.eyeLeftDown.target = clampedY < 0 ? -clampedY : 0;
+        const expressions = this.expressions;
         
-        this.expressions.eyeRightLeft.target = clampedX < 0 ? -clampedX : 0;
-        this.expressions.eyeRightRight.target = clampedX > 0 ? clampedX : 0;
-        this.expressions.eyeRightUp.target = clampedY > 0 ? clampedY : 0;
-        this.expressions.eyeRightDown.target = clampedY < 0 ? -clampedY : 0;
+        expressions.eyeLeftLeft.target = clampedX < 0 ? -clampedX : 0;
+        expressions.eyeLeftRight.target = clampedX > 0 ? clampedX : 0;
+        expressions.eyeLeftUp.target = clampedY > 0 ? clampedY : 0;
+        expressions.eyeLeftDown.target = clampedY < 0 ? -clampedY : 0;
+        
+        expressions.eyeRightLeft.target = clampedX < 0 ? -clampedX : 0;
+        expressions.eyeRightRight.target = clampedX > 0 ? clampedX : 0;
+        expressions.eyeRightUp.target = clampedY > 0 ? clampedY : 0;
+        expressions.eyeRightDown.target = clampedY < 0 ? -clampedY : 0;
     }
     
     blink(eye = 'both') {
@@ -762,6 +764,16 @@ export class AvatarController {
         }
     }
     
+    setVisemeWeights(weights) {
+        const targets = this.targetVisemeWeights;
+        const count = Math.min(targets.length, weights.length);
+        
+        for (let i = 0; i < count; i++) {
+            const weight = weights[i];
+            targets[i] = weight < 0 ? 0 : (weight > 1 ? 1 : weight);
+        }
+    }
+    
     update(deltaTime) {
         if (!this.avatarModel) return;
         
@@ -782,7 +794,9 @@ export class AvatarController {
     updateIdleAnimations(deltaTime) {
         if (!this.idleSystem.enabled) return;
         
-        const currentTime = Date.now();
+        // Blink schedule runs on the render clock, in ms
+        this.idleSystem.blinkTimer += deltaTime * 1000;
+        const currentTime = this.idleSystem.blinkTimer;
         
         if (currentTime > this.idleSystem.nextBlinkTime) {
             this.blink();
@@ -824,14 +838,18 @@ export class AvatarController {
     }
     
     updateFacialExpressions(deltaTime) {
-        Object.keys(this.expressions).forEach(exprName => {
-            const expr = this.expressions[exprName];
+        const expressions = this.expressions;
+        const blendSpeed = this.expressionBlendSpeed;
+        const decayRate = this.emotionDecayRate;
+        
+        for (const exprName of this.expressionNames) {
+            const expr = expressions[exprName];
             const diff = expr.target - expr.intensity;
             
-            expr.intensity += diff * this.expressionBlendSpeed;
+            expr.intensity += diff * blendSpeed;
             
             if (exprName !== 'neutral' && expr.target === 0) {
-                expr.intensity *= this.emotionDecayRate;
+                expr.intensity *= decayRate;
             }
             
             expr.intensity = Math.max(0, Math.min(1, expr.intensity));
@@ -839,36 +857,46 @@ export class AvatarController {
             if (Math.abs(diff) < 0.001) {
                 expr.intensity = expr.target;
             }
-        });
+        }
     }
     
     updateVisemeBlending(deltaTime) {
-        for (let i = 0; i < this.visemeWeights.length; i++) {
-            const target = this.targetVisemeWeights[i];
-            const current = this.visemeWeights[i];
-            const diff = target - current;
-            
-            this.visemeWeights[i] += diff * this.visemeBlendSpeed;
+        const weights = this.visemeWeights;
+        const targets = this.targetVisemeWeights;
+        const blendSpeed = this.visemeBlendSpeed;
+        
+        for (let i = 0; i < weights.length; i++) {
+            const target = targets[i];
+            const diff = target - weights[i];
             
             if (Math.abs(diff) < 0.001) {
-                this.visemeWeights[i] = target;
+                weights[i] = target;
+            } else {
+                weights[i] += diff * blendSpeed;
             }
         }
     }
     
     applyExpressionsToModel() {
         if (this.avatarMesh && this.avatarMesh.morphTargetInfluences) {
-            Object.keys(this.expressions).forEach(exprName => {
-                const morphIndex = this.morphTargets.get(exprName);
+            const influences = this.avatarMesh.morphTargetInfluences;
+            const morphTargets = this.morphTargets;
+            const expressions = this.expressions;
+            
+            for (const exprName of this.expressionNames) {
+                const morphIndex = morphTargets.get(exprName);
                 if (morphIndex !== undefined) {
-                    this.avatarMesh.morphTargetInfluences[morphIndex] = this.expressions[exprName].intensity;
+                    influences[morphIndex] = expressions[exprName].intensity;
                 }
-            });
+            }
             
-            for (let i = 0; i < this.visemeWeights.length; i++) {
-                const morphIndex = this.morphTargets.get(`viseme_${i}`);
+            const visemeWeights = this.visemeWeights;
+            const visemeMorphNames = this.visemeMorphNames;
+            
+            for (let i = 0; i < visemeWeights.length; i++) {
+                const morphIndex = morphTargets.get(visemeMorphNames[i]);
                 if (morphIndex !== undefined) {
-                    this.avatarMesh.morphTargetInfluences[morphIndex] = this.visemeWeights[i];
+                    influences[morphIndex] = visemeWeights[i];
                 }
             }
         } else {
@@ -878,17 +906,18 @@ export class AvatarController {
     
     applyToProceduralAvatar() {
         if (this.leftEye && this.rightEye) {
-            const leftBlinkIntensity = this.expressions.eyeBlinkLeft.intensity;
-            const rightBlinkIntensity = this.expressions.eyeBlinkRight.intensity;
+            const expressions = this.expressions;
+            const leftBlinkIntensity = expressions.eyeBlinkLeft.intensity;
+            const rightBlinkIntensity = expressions.eyeBlinkRight.intensity;
             
             this.leftEye.scale.y = 1 - leftBlinkIntensity * 0.8;
             this.rightEye.scale.y = 1 - rightBlinkIntensity * 0.8;
             
             const eyeMovementRange = 0.02;
-            const leftEyeX = (this.expressions.eyeLeftRight.intensity - this.expressions.eyeLeftLeft.intensity) * eyeMovementRange;
-            const leftEyeY = (this.expressions.eyeLeftUp.intensity - this.expressions.eyeLeftDown.intensity) * eyeMovementRange;
-            const rightEyeX = (this.expressions.eyeRightRight.intensity - this.expressions.eyeRightLeft.intensity) * eyeMovementRange;
-            const rightEyeY = (this.expressions.eyeRightUp.intensity - this.expressions.eyeRightDown.intensity) * eyeMovementRange;
+            const leftEyeX = (expressions.eyeLeftRight.intensity - expressions.eyeLeftLeft.intensity) * eyeMovementRange;
+            const leftEyeY = (expressions.eyeLeftUp.intensity - expressions.eyeLeftDown.intensity) * eyeMovementRange;
+            const rightEyeX = (expressions.eyeRightRight.intensity - expressions.eyeRightLeft.intensity) * eyeMovementRange;
+            const rightEyeY = (expressions.eyeRightUp.intensity - expressions.eyeRightDown.intensity) * eyeMovementRange;
             
             if (this.leftEyeBall) {
                 this.leftEyeBall.position.x = leftEyeX;
@@ -917,51 +946,45 @@ export class AvatarController {
             }
         }
         
-        const targetShape = this.proceduralVisemeShapes[dominantViseme] || this.proceduralVisemeShapes[13];
+        const shapes = this.proceduralVisemeShapes;
+        const offset = dominantViseme * this.proceduralVisemeStride;
+        const state = this.currentMouthState;
         
         const blendFactor = 0.1;
         
-        this.currentMouthState.upperLipScale.x += (targetShape.upperLipScale.x - this.currentMouthState.upperLipScale.x) * blendFactor;
-        this.currentMouthState.upperLipScale.y += (targetShape.upperLipScale.y - this.currentMouthState.upperLipScale.y) * blendFactor;
-        this.currentMouthState.upperLipScale.z += (targetShape.upperLipScale.z - this.currentMouthState.upperLipScale.z) * blendFactor;
-        
-        this.currentMouthState.lowerLipScale.x += (targetShape.lowerLipScale.x - this.currentMouthState.lowerLipScale.x) * blendFactor;
-        this.currentMouthState.lowerLipScale.y += (targetShape.lowerLipScale.y - this.currentMouthState.lowerLipScale.y) * blendFactor;
-        this.currentMouthState.lowerLipScale.z += (targetShape.lowerLipScale.z - this.currentMouthState.lowerLipScale.z) * blendFactor;
-        
-        this.upperLip.scale.set(
-            this.currentMouthState.upperLipScale.x,
-            this.currentMouthState.upperLipScale.y,
-            this.currentMouthState.upperLipScale.z
-        );
-        
-        this.lowerLip.scale.set(
-            this.currentMouthState.lowerLipScale.x,
-            this.currentMouthState.lowerLipScale.y,
-            this.currentMouthState.lowerLipScale.z
-        );
-        
-        if (targetShape.upperLipPos) {
-            this.upperLip.position.y = 1.63 + (targetShape.upperLipPos.y || 0);
+        let maxDelta = 0;
+        for (let i = 0; i < state.length; i++) {
+            const delta = shapes[offset + i] - state[i];
+            state[i] += delta * blendFactor;
+            maxDelta = Math.max(maxDelta, Math.abs(delta));
         }
-        if (targetShape.lowerLipPos) {
-            this.lowerLip.position.y = 1.57 + (targetShape.lowerLipPos.y || 0);
+        
+        // Once the lips have settled on a shape there is nothing to write back
+        if (maxDelta > 0.0001 || dominantViseme !== this.appliedMouthViseme) {
+            this.upperLip.scale.set(state[0], state[1], state[2]);
+            this.lowerLip.scale.set(state[3], state[4], state[5]);
+            
+            this.upperLip.position.y = 1.63 + shapes[offset + 6];
+            this.lowerLip.position.y = 1.57 + shapes[offset + 7];
+            
+            this.appliedMouthViseme = dominantViseme;
         }
         
         if (this.teeth) {
-            this.teeth.visible = targetShape.showTeeth && maxWeight > 0.3;
+            this.teeth.visible = this.proceduralVisemeTeeth[dominantViseme] === 1 && maxWeight > 0.3;
         }
         if (this.tongue) {
-            this.tongue.visible = targetShape.showTongue && maxWeight > 0.5;
+            this.tongue.visible = this.proceduralVisemeTongue[dominantViseme] === 1 && maxWeight > 0.5;
         }
     }
     
     applyEmotionsToProceduralHead() {
         if (!this.avatarMesh) return;
         
-        const happyIntensity = this.expressions.happy.intensity;
-        const sadIntensity = this.expressions.sad.intensity;
-        const angryIntensity = this.expressions.angry.intensity;
+        const expressions = this.expressions;
+        const happyIntensity = expressions.happy.intensity;
+        const sadIntensity = expressions.sad.intensity;
+        const angryIntensity = expressions.angry.intensity;
         
         const headTiltX = (happyIntensity * 0.05) - (sadIntensity * 0.1) + (angryIntensity * 0.03);
         const headTiltZ = (happyIntensity * 0.02) - (angryIntensity * 0.02);
@@ -1004,12 +1027,37 @@ export class AvatarController {
         reject(error);
     }
     
+    scheduleResize() {
+        // Drags fire a burst of resize events; only the last one needs handling
+        if (this.resizeTimeoutId !== null) {
+            clearTimeout(this.resizeTimeoutId);
+        }
+        
+        this.resizeTimeoutId = setTimeout(() => {
+            this.resizeTimeoutId = null;
+            this.onWindowResize();
+        }, this.resizeDebounceMs);
+    }
+    
     onWindowResize() {
         if (!this.camera || !this.renderer || !this.canvas) return;
         
         const width = this.canvas.clientWidth;
         const height = this.canvas.clientHeight;
         
+        // A hidden canvas reports zero size; keep the last real size until it is shown again
+        if (width === 0 || height === 0) {
+            return;
+        }
+        
+        // Resize events also fire for changes that leave the canvas size alone
+        if (width === this.renderWidth && height === this.renderHeight) {
+            return;
+        }
+        
+        this.renderWidth = width;
+        this.renderHeight = height;
+        
         this.camera.aspect = width / height;
         this.camera.updateProjectionMatrix();
         
@@ -1098,7 +1146,15 @@ export class AvatarController {
             this.controls.dispose();
         }
         
-        window.removeEventListener('resize', this.onWindowResize);
+        window.removeEventListener('resize', this.scheduleResize);
+        
+        this.expressionResetTimeouts.forEach(timeoutId => clearTimeout(timeoutId));
+        this.expressionResetTimeouts.clear();
+        
+        if (this.resizeTimeoutId !== null) {
+            clearTimeout(this.resizeTimeoutId);
+            this.resizeTimeoutId = null;
+        }
         
         console.log('Avatar Controller cleaned up');
     }
@@ -10,6 +10,12 @@ export class LipSyncController {
         this.audioPlayer = audioPlayer;
         
         this.phonemeTimings = [];
+        this.timingStarts = new Float64Array(0);
+        this.timingEnds = new Float64Array(0);
+        this.timingBins = new Uint16Array(0);
+        this.timingBinSize = 10;
+        this.timingCount = 0;
+        this.visemeDistribution = new Float64Array(14);
         this.currentTimingIndex = 0;
         this.phonemeMap = {};
         
@@ -65,8 +71,8 @@ export class LipSyncController {
     }
     
     setupVisemeBlending() {
-        this.visemeBlendWeights = new Array(14).fill(0);
-        this.targetVisemeWeights = new Array(14).fill(0);
+        this.visemeBlendWeights = new Float32Array(14);
+        this.targetVisemeWeights = new Float32Array(14);
         this.visemeCoarticulation = {
             enabled: true,
             strength: 0.3,
@@ -90,6 +96,27 @@ export class LipSyncController {
             disgusted: { intensity: 0.7, openness: 0.7, roundness: 0.8 },
             neutral: { intensity: 1.0, openness: 1.0, roundness: 1.0 }
         };
+        
+        this.emotionalModulationTables = {};
+        this.emotionalModulationFactors = new Float64Array(14);
+        for (const [emotion, influence] of Object.entries(this.emotionalInfluenceMap)) {
+            const table = new Float64Array(14);
+            
+            for (let i = 0; i < table.length; i++) {
+                let modulation = influence.intensity;
+                
+                if (i <= 4) {
+                    modulation *= influence.openness;
+                }
+                if (i === 1 || i === 4) {
+                    modulation *= influence.roundness;
+                }
+                
+                table[i] = modulation;
+            }
+            
+            this.emotionalModulationTables[emotion] = table;
+        }
     }
     
     getDefaultPhonemeMap() {
@@ -142,6 +169,8 @@ export class LipSyncController {
             this.applyCoarticulation();
         }
         
+        this.buildTimingSchedule();
+        
         this.currentTimingIndex = 0;
         this.currentViseme = 13;
         this.targetViseme = 13;
@@ -153,24 +182,86 @@ export class LipSyncController {
         }
     }
     
+    buildTimingSchedule() {
+        const count = this.phonemeTimings.length;
+        this.timingCount = count;
+        this.timingStarts = new Float64Array(count);
+        this.timingEnds = new Float64Array(count);
+        
+        for (let i = 0; i < count; i++) {
+            this.timingStarts[i] = this.phonemeTimings[i].start_ms;
+            this.timingEnds[i] = this.phonemeTimings[i].end_ms;
+        }
+        
+        // timingBins[b] is the first timing whose end is past b * timingBinSize:
+        // every earlier timing ends before that bin, so a lookup can start its
+        // scan there after a seek. Timings are sorted by start only; ends need
+        // not be monotone (a long phoneme may outlast the next one, and
+        // loadTimings repairs invalid ends), so the bins cover up to the
+        // latest end rather than the last timing's end
+        let maxEnd = 0;
+        for (let i = 0; i < count; i++) {
+            if (this.timingEnds[i] > maxEnd) {
+                maxEnd = this.timingEnds[i];
+            }
+        }
+        const binCount = Math.floor(maxEnd / this.timingBinSize) + 1;
+        // Indices fit in 16 bits for any text the server accepts
+        const BinArray = count <= 0xFFFF ? Uint16Array : Uint32Array;
+        this.timingBins = new BinArray(binCount);
+        
+        // Stops at the first end past binStart, skipping each earlier timing
+        // on its own end, which stays valid when ends are not monotone
+        let index = 0;
+        for (let b = 0; b < binCount; b++) {
+            const binStart = b * this.timingBinSize;
+            while (index < count && this.timingEnds[index] <= binStart) {
+                index++;
+            }
+            this.timingBins[b] = index;
+        }
+        
+        // Share of speaking time per viseme, reported by getVisemeDistribution
+        const distribution = new Float64Array(14);
+        let total = 0;
+        for (let i = 0; i < count; i++) {
+            const timing = this.phonemeTimings[i];
+            if (timing.viseme_index >= 0 && timing.viseme_index < 14) {
+                distribution[timing.viseme_index] += timing.duration_ms;
+                total += timing.duration_ms;
+            }
+        }
+        if (total > 0) {
+            for (let v = 0; v < 14; v++) {
+                distribution[v] /= total;
+            }
+        }
+        this.visemeDistribution = distribution;
+    }
+    
     applyCoarticulation() {
         const windowSize = this.visemeCoarticulation.windowSize;
         const strength = this.visemeCoarticulation.strength;
         
-        for (let i = 0; i < this.phonemeTimings.length; i++) {
-            const current = this.phonemeTimings[i];
-            const neighbors = [];
+        const timings = this.phonemeTimings;
+        const lastIndex = timings.length - 1;
+        
+        for (let i = 0; i <= lastIndex; i++) {
+            const current = timings[i];
+            const windowEnd = Math.min(lastIndex, i + windowSize);
+            const coarticulation = [];
             
-            for (let j = Math.max(0, i - windowSize); j <= Math.min(this.phonemeTimings.length - 1, i + windowSize); j++) {
+            for (let j = Math.max(0, i - windowSize); j <= windowEnd; j++) {
                 if (j !== i) {
-                    neighbors.push(this.phonemeTimings[j]);
+                    const neighbor = timings[j];
+                    coarticulation.push({
+                        viseme_index: neighbor.viseme_index,
+                        influence: strength * Math.exp(-Math.abs(neighbor.start_ms - current.start_ms) / 100)
+                    });
                 }
             }
             
-            current.coarticulation = neighbors.map(neighbor => ({
-                viseme_index: neighbor.viseme_index,
-                influence: strength * Math.exp(-Math.abs(neighbor.start_ms - current.start_ms) / 100)
-            }));
+            current.coarticulation = coarticulation;
         }
     }
     
@@ -263,7 +354,12 @@ export class LipSyncController {
             const processingTime = performance.now() - processingStart;
             this.updatePerformanceMetrics(processingTime, deltaTime);
             
-            this.lastUpdateTime = currentTime;
+            // Advance on a fixed grid so the update rate does not drift with
+            // frame jitter; resync if we have fallen more than a tick behind
+            this.lastUpdateTime += this.syncUpdateInterval;
+            if (currentTime - this.lastUpdateTime >= this.syncUpdateInterval) {
+                this.lastUpdateTime = currentTime;
+            }
         }
         
         this.scheduleUpdate();
@@ -271,14 +367,13 @@ export class LipSyncController {
     
     updateLipSync() {
         try {
-            const audioTimeMs = this.audioPlayer.getCurrentTimeMs();
+            const audioTimeMs = this.audioPlayer.getAudibleTimeMs();
             
             const currentTiming = this.findCurrentTiming(audioTimeMs);
             const nextTiming = this.findNextTiming(audioTimeMs);
             
             this.updateViseme(currentTiming, nextTiming, audioTimeMs);
             this.updateVisemeBlending();
-            this.applyEmotionalModulation();
             this.applyToAvatar();
             
         } catch (error) {
@@ -287,39 +382,43 @@ export class LipSyncController {
     }
     
     findCurrentTiming(timeMs) {
-        for (let i = this.currentTimingIndex; i < this.phonemeTimings.length; i++) {
-            const timing = this.phonemeTimings[i];
-            
-            if (timeMs >= timing.start_ms && timeMs < timing.end_ms) {
-                this.currentTimingIndex = i;
-                return timing;
-            }
-            
-            if (timeMs >= timing.end_ms) {
-                this.currentTimingIndex = i + 1;
-            }
+        const starts = this.timingStarts;
+        const ends = this.timingEnds;
+        const count = this.timingCount;
+        
+        if (count === 0) {
+            return null;
         }
         
-        for (let i = Math.max(0, this.currentTimingIndex - 5); i < this.currentTimingIndex; i++) {
-            const timing = this.phonemeTimings[i];
-            if (timeMs >= timing.start_ms && timeMs < timing.end_ms) {
-                this.currentTimingIndex = i;
-                return timing;
-            }
+        const bin = Math.min(this.timingBins.length - 1, Math.floor(timeMs / this.timingBinSize));
+        let i = this.timingBins[bin];
+        
+        while (i < count && ends[i] <= timeMs) {
+            i++;
+        }
+        
+        this.currentTimingIndex = i;
+        
+        if (i < count && starts[i] <= timeMs) {
+            return this.phonemeTimings[i];
         }
         
         return null;
     }
     
     findNextTiming(timeMs) {
-        const lookAheadMs = timeMs + this.lookAheadTime;
+        const starts = this.timingStarts;
+        const count = this.timingCount;
+        let i = this.currentTimingIndex;
         
-        for (let i = this.currentTimingIndex; i < this.phonemeTimings.length; i++) {
-            const timing = this.phonemeTimings[i];
-            
-            if (timing.start_ms > timeMs && timing.start_ms <= lookAheadMs) {
-                return timing;
-            }
+        // currentTimingIndex is the first timing still running, so the next
+        // one to start is right after it and the scan ends within a step or two
+        while (i < count && starts[i] <= timeMs) {
+            i++;
+        }
+        
+        if (i < count && starts[i] <= timeMs + this.lookAheadTime) {
+            return this.phonemeTimings[i];
         }
         
         return null;
@@ -377,69 +476,63 @@ export class LipSyncController {
         if (this.visemeBlendProgress >= 1.0) {
             this.targetVisemeWeights[this.targetViseme] = 1.0;
         } else {
-            const currentWeight = 1.0 - this.visemeBlendProgress;
-            const targetWeight = this.visemeBlendProgress;
+            // Progress is below 1 here, so the outgoing viseme always keeps some weight
+            this.targetVisemeWeights[this.currentViseme] = 1.0 - this.visemeBlendProgress;
             
-            if (currentWeight > 0) {
-                this.targetVisemeWeights[this.currentViseme] = currentWeight;
-            }
-            if (targetWeight > 0) {
-                this.targetVisemeWeights[this.targetViseme] = targetWeight;
+            if (this.visemeBlendProgress > 0) {
+                this.targetVisemeWeights[this.targetViseme] = this.visemeBlendProgress;
             }
         }
         
-        for (let i = 0; i < this.visemeBlendWeights.length; i++) {
-            const target = this.targetVisemeWeights[i];
-            const current = this.visemeBlendWeights[i];
-            const diff = target - current;
-            
-            this.visemeBlendWeights[i] += diff * 0.15;
+        const weights = this.visemeBlendWeights;
+        const targets = this.targetVisemeWeights;
+        const modulation = this.getEmotionalModulationFactors();
+        
+        // Blend and emotional modulation share one pass over the weights
+        for (let i = 0; i < weights.length; i++) {
+            const target = targets[i];
+            const diff = target - weights[i];
             
             if (Math.abs(diff) < 0.001) {
-                this.visemeBlendWeights[i] = target;
+                weights[i] = target;
+            } else {
+                weights[i] += diff * 0.15;
+            }
+            
+            if (modulation && weights[i] > 0) {
+                weights[i] *= modulation[i];
             }
         }
     }
     
     applyCoarticulationEffects(coarticulation) {
-        coarticulation.forEach(effect => {
-            const visemeIndex = effect.viseme_index;
-            const influence = effect.influence;
+        const targets = this.targetVisemeWeights;
+        
+        for (let i = 0; i < coarticulation.length; i++) {
+            const visemeIndex = coarticulation[i].viseme_index;
             
-            if (visemeIndex >= 0 && visemeIndex < this.targetVisemeWeights.length) {
-                this.targetVisemeWeights[visemeIndex] += influence;
-                this.targetVisemeWeights[visemeIndex] = Math.min(1.0, this.targetVisemeWeights[visemeIndex]);
+            if (visemeIndex >= 0 && visemeIndex < targets.length) {
+                targets[visemeIndex] = Math.min(1.0, targets[visemeIndex] + coarticulation[i].influence);
             }
-        });
+        }
     }
     
-    applyEmotionalModulation() {
+    getEmotionalModulationFactors() {
         if (!this.emotionalModulation.enabled) {
-            return;
+            return null;
         }
         
         const emotion = this.emotionalModulation.currentEmotion;
-        const intensity = this.emotionalModulation.intensity;
-        const influence = this.emotionalInfluenceMap[emotion] || this.emotionalInfluenceMap.neutral;
+        const modulationTable = this.emotionalModulationTables[emotion] || this.emotionalModulationTables.neutral;
+        const emotionalInfluence = this.expressionInfluence * this.emotionalModulation.intensity;
+        const factors = this.emotionalModulationFactors;
         
-        for (let i = 0; i < this.visemeBlendWeights.length; i++) {
-            if (this.visemeBlendWeights[i] > 0) {
-                let modulation = 1.0;
-                
-                if ([0, 1, 2, 3, 4].includes(i)) {
-                    modulation *= influence.openness;
-                }
-                if ([1, 4].includes(i)) {
-                    modulation *= influence.roundness;
-                }
-                
-                modulation *= influence.intensity;
-                
-                const emotionalInfluence = this.expressionInfluence * intensity;
-                this.visemeBlendWeights[i] = this.visemeBlendWeights[i] * (1 - emotionalInfluence) + 
-                                           (this.visemeBlendWeights[i] * modulation) * emotionalInfluence;
-            }
+        // w * (1 - influence) + (w * modulation) * influence, folded into one factor
+        for (let i = 0; i < factors.length; i++) {
+            factors[i] = (1 - emotionalInfluence) + modulationTable[i] * emotionalInfluence;
         }
+        
+        return factors;
     }
     
     applyToAvatar() {
@@ -447,9 +540,7 @@ export class LipSyncController {
             return;
         }
         
-        for (let i = 0; i < this.visemeBlendWeights.length; i++) {
-            this.avatarController.setViseme(i, this.visemeBlendWeights[i]);
-        }
+        this.avatarController.setVisemeWeights(this.visemeBlendWeights);
     }
     
     resetVisemeWeights() {
@@ -476,7 +567,12 @@ export class LipSyncController {
     }
     
     easeInOutCubic(t) {
-        return t < 0.5 ? 4 * t * t * t : 1 - Math.pow(-2 * t + 2, 3) / 2;
+        if (t < 0.5) {
+            return 4 * t * t * t;
+        }
+        
+        const u = 2 - 2 * t;
+        return 1 - u * u * u / 2;
     }
     
     updatePerformanceMetrics(processingTime, deltaTime) {
@@ -500,7 +596,7 @@ export class LipSyncController {
             blendProgress: this.visemeBlendProgress,
             currentTimingIndex: this.currentTimingIndex,
             totalTimings: this.phonemeTimings.length,
-            audioTime: this.audioPlayer ? this.audioPlayer.getCurrentTimeMs() : 0,
+            audioTime: this.audioPlayer ? this.audioPlayer.getAudibleTimeMs() : 0,
             emotionalModulation: this.emotionalModulation,
             performanceMetrics: this.adaptiveSync.performanceMetrics,
             visemeWeights: [...this.visemeBlendWeights]
@@ -508,7 +604,7 @@ export class LipSyncController {
     }
     
     logCurrentTiming() {
-        const audioTimeMs = this.audioPlayer ? this.audioPlayer.getCurrentTimeMs() : 0;
+        const audioTimeMs = this.audioPlayer ? this.audioPlayer.getAudibleTimeMs() : 0;
         const currentTiming = this.findCurrentTiming(audioTimeMs);
         const nextTiming = this.findNextTiming(audioTimeMs);
         
@@ -580,7 +676,7 @@ export class LipSyncController {
             return 1.0;
         }
         
-        const audioTime = this.audioPlayer.getCurrentTimeMs();
+        const audioTime = this.audioPlayer.getAudibleTimeMs();
         const timing = this.findCurrentTiming(audioTime);
         
         if (!timing) {
@@ -595,17 +691,7 @@ export class LipSyncController {
     }
     
     getVisemeDistribution() {
-        const distribution = new Array(14).fill(0);
-        let total = 0;
-        
-        this.phonemeTimings.forEach(timing => {
-            if (timing.viseme_index >= 0 && timing.viseme_index < 14) {
-                distribution[timing.viseme_index] += timing.duration_ms;
-                total += timing.duration_ms;
-            }
-        });
-        
-        return distribution.map(count => total > 0 ? count / total : 0);
+        return Array.from(this.visemeDistribution);
     }
     
     getPerformanceProfile() {
@@ -620,6 +706,11 @@ export class LipSyncController {
     cleanup() {
         this.stop();
         this.phonemeTimings = [];
+        this.timingStarts = new Float64Array(0);
+        this.timingEnds = new Float64Array(0);
+        this.timingBins = new Uint16Array(0);
+        this.timingCount = 0;
+        this.visemeDistribution = new Float64Array(14);
         this.currentTimingIndex = 0;
         this.avatarController = null;
         this.audioPlayer = null;
@@ -0,0 +1,87 @@
+/**
+ * Procedural avatar construction tests
+ * three.js is loaded from a CDN in the page, so these tests provide a
+ * minimal recording stand-in for the few classes the builders use
+ */
+
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+
+class Vector {
+    constructor() {
+        this.x = 0;
+        this.y = 0;
+        this.z = 0;
+    }
+    
+    set(x, y, z) {
+        this.x = x;
+        this.y = y;
+        this.z = z;
+    }
+}
+
+class Object3D {
+    constructor() {
+        this.position = new Vector();
+        this.rotation = new Vector();
+        this.scale = new Vector();
+        this.matrix = null;
+        this.frustumCulled = true;
+    }
+    
+    updateMatrix() {
+        this.matrix = { position: { ...this.position }, rotation: { ...this.rotation } };
+    }
+}
+
+class Mesh extends Object3D {
+    constructor(geometry, material) {
+        super();
+        this.geometry = geometry;
+        this.material = material;
+    }
+}
+
+class InstancedMesh extends Mesh {
+    constructor(geometry, material, count) {
+        super(geometry, material);
+        this.count = count;
+        this.matrices = new Array(count).fill(null);
+        this.instanceMatrix = { needsUpdate: false };
+    }
+    
+    setMatrixAt(index, matrix) {
+        this.matrices[index] = matrix;
+    }
+}
+
+globalThis.THREE = {
+    Object3D,
+    Mesh,
+    InstancedMesh,
+    SphereGeometry: class {},
+    CylinderGeometry: class {},
+    MeshPhysicalMaterial: class {}
+};
+
+const { AvatarController } = await import('../js/avatar-controller.js');
+
+test('hair strands are one instanced mesh that is never frustum culled', () => {
+    const children = [];
+    const group = { add: (child) => children.push(child) };
+    
+    AvatarController.prototype.createDetailedHair.call({}, group);
+    
+    const strands = children.filter(child => child instanceof InstancedMesh);
+    assert.equal(strands.length, 1);
+    assert.equal(children.length, 2);
+    
+    const [hair] = strands;
+    assert.equal(hair.frustumCulled, false);
+    assert.equal(hair.instanceMatrix.needsUpdate, true);
+    assert.ok(hair.matrices.every(matrix => matrix !== null));
+    
+    // Strands sit on the head, well above the group origin the base geometry bounds assume
+    assert.ok(hair.matrices.every(matrix => matrix.position.y >= 1.9));
+});
@@ -0,0 +1,74 @@
+/**
+ * Lip sync timing lookup tests
+ * Compares the binned timing schedule against a brute-force search,
+ * including schedules whose end times are not monotone
+ */
+
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+
+import { LipSyncController } from '../js/lipsync_controller.js';
+
+function makeTimings(count, longProbability) {
+    const timings = [];
+    let start = 0;
+    
+    for (let i = 0; i < count; i++) {
+        start += Math.random() * 40;
+        const duration = Math.random() < longProbability
+            ? Math.random() * 400 + 1
+            : Math.random() * 30 + 1;
+        timings.push({
+            start_ms: start,
+            end_ms: start + duration,
+            duration_ms: duration,
+            viseme_index: i % 14
+        });
+    }
+    
+    return timings;
+}
+
+function checkAgainstBruteForce(timings) {
+    const controller = new LipSyncController(null, null);
+    controller.phonemeTimings = timings;
+    controller.buildTimingSchedule();
+    
+    const maxEnd = Math.max(...timings.map(timing => timing.end_ms));
+    
+    for (let k = 0; k < 500; k++) {
+        const timeMs = Math.random() * (maxEnd + 100);
+        
+        const current = timings.find(timing => timeMs >= timing.start_ms && timeMs < timing.end_ms) || null;
+        assert.equal(controller.findCurrentTiming(timeMs), current);
+        
+        const next = timings.find(timing =>
+            timing.start_ms > timeMs && timing.start_ms <= timeMs + controller.lookAheadTime) || null;
+        assert.equal(controller.findNextTiming(timeMs), next);
+    }
+}
+
+test('lookups match brute force for back-to-back timings', () => {
+    for (let trial = 0; trial < 50; trial++) {
+        checkAgainstBruteForce(makeTimings(200, 0));
+    }
+});
+
+test('lookups match brute force when a long timing outlasts later ones', () => {
+    for (let trial = 0; trial < 50; trial++) {
+        checkAgainstBruteForce(makeTimings(200, 0.2));
+    }
+});
+
+test('a long first timing is found past the last timing end', () => {
+    const timings = [
+        { start_ms: 0, end_ms: 1000, duration_ms: 1000, viseme_index: 1 },
+        { start_ms: 10, end_ms: 20, duration_ms: 10, viseme_index: 2 }
+    ];
+    const controller = new LipSyncController(null, null);
+    controller.phonemeTimings = timings;
+    controller.buildTimingSchedule();
+    
+    assert.equal(controller.timingBins.length, 101);
+    assert.equal(controller.findCurrentTiming(500), timings[0]);
+});